@@ -82,11 +82,15 @@ class Settings:
 
         # Return the setting value based on its type (fixed, user-defined, or default)
         if name in FIXED_SETTINGS:
-            return FIXED_SETTINGS[name]
-        if name in self.user_settings:
-            return self.user_settings[name]
-
-        return DEFAULT_SETTINGS[name]
+            value = FIXED_SETTINGS[name]
+        elif name in self.user_settings:
+            value = self.user_settings[name]
+        else:
+            value = DEFAULT_SETTINGS[name]
+
+        # Cache the value so that later reads are plain attribute lookups
+        setattr(self, name, value)
+        return value
 
 
 # Initialize settings object
@@ -1,5 +1,6 @@
 """Module for converting a AdvancedFilterSet class to filter arguments."""
 
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional, Sequence, Type, cast
 
 import graphene
@@ -71,12 +72,12 @@ class FilterArgumentsFactory:
         Returns:
             A dictionary mapping from argument names to graphene.Argument objects.
         """
-        input_object_type = self.input_object_types.get(
-            self.filter_input_type_name,
-            self.create_filter_input_type(
+        # Only build the trees and the input type if they are not cached yet
+        input_object_type = self.input_object_types.get(self.filter_input_type_name)
+        if input_object_type is None:
+            input_object_type = self.create_filter_input_type(
                 self.filterset_to_trees(self.filterset_class),
-            ),
-        )
+            )
         return {
             settings.FILTER_KEY: graphene.Argument(
                 input_object_type,
@@ -234,11 +235,14 @@ class FilterArgumentsFactory:
         return field_type
 
     @classmethod
+    @lru_cache(maxsize=None)
     def filterset_to_trees(cls, filterset_class: Type[AdvancedFilterSet]) -> List[Node]:
         """
         Convert a FilterSet class to a list of trees.
 
         where each tree represents a set of chained lookups for a filter.
+        The trees only depend on the class, so they are built once and shared;
+        callers must not mutate them.
 
         Parameters:
         - filterset_class (Type[AdvancedFilterSet]): The FilterSet class to be converted.
@@ -246,8 +250,8 @@ class FilterArgumentsFactory:
         Returns:
         - List[Node]: A list of root nodes for each tree, each representing a filter.
         """
-        # Initialize an empty list to hold the root nodes of the trees.
-        trees: List[Node] = []
+        # Root nodes of the trees by name, so that each filter finds its tree directly.
+        trees: Dict[str, Node] = {}
 
         # Iterate through each filter in the FilterSet's base_filters.
         for filter_value in filterset_class.base_filters.values():
@@ -257,14 +261,15 @@ class FilterArgumentsFactory:
                 filter_value.lookup_expr,
             )
 
-            # Check if any existing tree can accommodate the new sequence of values.
-            # If not, create a new tree for it.
-            if not trees or not any(
-                cls.try_add_sequence(tree, values) for tree in trees
-            ):
-                trees.append(cls.sequence_to_tree(values))
+            # Add the sequence of values to the tree with the same root name.
+            # If there is no such tree, create a new tree for it.
+            tree = trees.get(values[0])
+            if tree is None:
+                trees[values[0]] = cls.sequence_to_tree(values)
+            else:
+                cls.try_add_sequence(tree, values)
 
-        return trees
+        return list(trees.values())
 
     @classmethod
     def try_add_sequence(cls, root: Node, values: Sequence[str]) -> bool:
@@ -288,7 +293,7 @@ class FilterArgumentsFactory:
             if cls.try_add_sequence(child, values[1:]):
                 return True
         # Add a new subtree rooted at `root` if the sequence could not be added to any child
-        root.children = (*root.children, cls.sequence_to_tree(values[1:]))
+        cls.sequence_to_tree(values[1:]).parent = root
         return True
 
     @staticmethod
@@ -2,6 +2,8 @@
 
 from typing import Any, Callable, List, NamedTuple, Optional, Type, Union
 
+import django
+from django.contrib.postgres.lookups import TrigramSimilar
 from django.contrib.postgres.search import (
     SearchQuery,
     SearchRank,
@@ -56,11 +58,51 @@ class AnnotatedFilter(Filter):
             **kwargs,
         )
         self.filter_counter = 0
+        self._annotation_prefix: Optional[str] = None
+        # Suffix appended to the annotation name to filter on it
+        self._lookup_suffix = f"{LOOKUP_SEP}{self.lookup_expr}"
+
+    @property
+    def requires_annotation(self) -> bool:
+        """Return True if the filter is applied on a QuerySet annotation."""
+        return True
+
+    @property
+    def can_batch_annotation(self) -> bool:
+        """
+        Return True if `AdvancedFilterSet` may annotate the QuerySet for this filter.
+
+        This only holds for the built-in `filter` implementations.
+        A `method` or an overridden `filter` is always called to apply the filter.
+        """
+        return (
+            self.requires_annotation
+            and self.method is None
+            and type(self).filter in _BATCHABLE_FILTER_METHODS
+        )
 
     @property
     def annotation_name(self) -> str:
         """Return a unique name used for the annotation."""
-        return f"{self.field_name}_{self.postfix}_{self.creation_counter}_{self.filter_counter}"
+        # Only the counter changes between calls, so the prefix is built once
+        if self._annotation_prefix is None:
+            self._annotation_prefix = (
+                f"{self.field_name}_{self.postfix}_{self.creation_counter}_"
+            )
+        return f"{self._annotation_prefix}{self.filter_counter}"
+
+    def is_empty_value(self, value: Any) -> bool:
+        """Return True if the filter must not be applied for the value."""
+        # The common `Value` instances are never empty, skip comparing them
+        return value is None or (
+            type(value) is not self.Value and value in EMPTY_VALUES
+        )
+
+    def next_annotation_name(self) -> str:
+        """Return a unique name for a new annotation and advance the counter."""
+        annotation_name = self.annotation_name
+        self.filter_counter += 1
+        return annotation_name
 
     def filter(self, qs: models.QuerySet, value: Value) -> models.QuerySet:
         """
@@ -68,15 +110,35 @@ class AnnotatedFilter(Filter):
 
         Generates a QuerySet annotation and filters based on the generated annotation.
         """
-        if value in EMPTY_VALUES:
+        if self.is_empty_value(value):
             return qs
-        if self.distinct:
-            qs = qs.distinct()
-        annotation_name = self.annotation_name
-        self.filter_counter += 1
+        annotation_name = self.next_annotation_name()
         qs = qs.annotate(**{annotation_name: value.annotation_value})
-        lookup = f"{annotation_name}{LOOKUP_SEP}{self.lookup_expr}"
-        return self.get_method(qs)(**{lookup: value.search_value})
+        return self.filter_annotation(qs, annotation_name, value)
+
+    def distinct_queryset(self, qs: models.QuerySet) -> models.QuerySet:
+        """Return a distinct QuerySet if the filter requires it."""
+        # `distinct()` clones the QuerySet, skip it if the query is already distinct
+        if self.distinct and not qs.query.distinct:
+            return qs.distinct()
+        return qs
+
+    def filter_annotation(
+        self,
+        qs: models.QuerySet,
+        annotation_name: str,
+        value: Value,
+    ) -> models.QuerySet:
+        """
+        Filter the QuerySet on an annotation that is already applied.
+
+        `AdvancedFilterSet` annotates the QuerySet once for all annotated filters
+        of a form and then calls this method for each of them.
+        """
+        qs = self.distinct_queryset(qs)
+        return self.get_method(qs)(
+            **{annotation_name + self._lookup_suffix: value.search_value}
+        )
 
 
 class SearchQueryFilter(AnnotatedFilter):
@@ -87,19 +149,49 @@ class SearchQueryFilter(AnnotatedFilter):
     """
 
     class Value(NamedTuple):
-        annotation_value: SearchVector
+        annotation_value: Optional[SearchVector]
         search_value: SearchQuery
 
     postfix = "search_query"
     available_lookups = ("exact",)
 
+    def __init__(
+        self,
+        field_name: Optional[str] = None,
+        lookup_expr: Optional[str] = None,
+        *,
+        vector_field: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the filter.
+
+        If `vector_field` names a persisted `SearchVectorField` of the model,
+        the search query is matched against that column instead of a `SearchVector`
+        computed for every row. Back the column with a `GinIndex` so that
+        PostgreSQL can use the index for the lookup. The generated `search_query`
+        filter takes the column from the `search_vector_field` FilterSet Meta option.
+        """
+        super().__init__(field_name, lookup_expr, **kwargs)
+        self.vector_field = vector_field
+
+    @property
+    def requires_annotation(self) -> bool:
+        """Return True if the search vector is computed with an annotation."""
+        return self.vector_field is None
+
     def filter(self, qs: models.QuerySet, value: Value) -> models.QuerySet:
         """
         Apply full-text search filtering on the QuerySet.
 
-        Uses the `SearchVector` and `SearchQuery` object.
+        Uses the `SearchVector` and `SearchQuery` object,
+        or the `vector_field` column and the `SearchQuery` object.
         """
-        return super().filter(qs, value)
+        if self.requires_annotation:
+            return super().filter(qs, value)
+        if self.is_empty_value(value):
+            return qs
+        return self.filter_annotation(qs, self.vector_field, value)
 
 
 class SearchRankFilter(AnnotatedFilter):
@@ -135,6 +227,35 @@ class TrigramFilter(AnnotatedFilter):
 
     postfix = "trigram"
     available_lookups = ("exact", "gt", "gte", "lt", "lte")
+    # Default value of the `pg_trgm.similarity_threshold` setting
+    default_similarity_threshold = 0.3
+
+    def __init__(
+        self,
+        field_name: Optional[str] = None,
+        lookup_expr: Optional[str] = None,
+        *,
+        use_operator: bool = False,
+        similarity_threshold: Optional[float] = None,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize the filter.
+
+        With `use_operator`, similarity filters that are stricter than `similarity_threshold`
+        also get the `%` operator (the `trigram_similar` lookup) so that PostgreSQL can use
+        a `GIN (field gin_trgm_ops)` index instead of computing the similarity for every row.
+        `similarity_threshold` must match the `pg_trgm.similarity_threshold` setting.
+        The generated trigram filters take both values from the `trigram_use_operator`
+        and `trigram_similarity_threshold` FilterSet Meta options.
+        """
+        super().__init__(field_name, lookup_expr, **kwargs)
+        self.use_operator = use_operator
+        self.similarity_threshold = (
+            self.default_similarity_threshold
+            if similarity_threshold is None
+            else similarity_threshold
+        )
 
     def filter(self, qs: models.QuerySet, value: Value) -> models.QuerySet:
         """
@@ -144,6 +265,58 @@ class TrigramFilter(AnnotatedFilter):
         """
         return super().filter(qs, value)
 
+    def filter_annotation(
+        self,
+        qs: models.QuerySet,
+        annotation_name: str,
+        value: Value,
+    ) -> models.QuerySet:
+        """Filter the QuerySet on the trigram annotation, using the `%` operator if possible."""
+        if not self.can_use_operator(value):
+            return super().filter_annotation(qs, annotation_name, value)
+        qs = self.distinct_queryset(qs)
+        # The `%` condition is an alias over the expressions of the annotation,
+        # so it reuses the joins of the annotation and compares the same related rows.
+        # Every row matching the annotation lookup then also matches the operator,
+        # the operator only lets the index narrow down the rows to compare.
+        operator_name = f"{annotation_name}_similar"
+        qs = qs.alias(
+            **{
+                operator_name: TrigramSimilar(
+                    *value.annotation_value.get_source_expressions()
+                ),
+            }
+        )
+        return self.get_method(qs)(
+            **{
+                annotation_name + self._lookup_suffix: value.search_value,
+                operator_name: True,
+            }
+        )
+
+    def can_use_operator(self, value: Value) -> bool:
+        """Return True if the `%` operator does not change the result of the filter."""
+        # Lookups can only be used as expressions since Django 4.0
+        return (
+            self.use_operator
+            and django.VERSION >= (4, 0)
+            and self.lookup_expr in ("gt", "gte")
+            and isinstance(value.annotation_value, TrigramSimilarity)
+            and value.search_value is not None
+            and value.search_value > self.similarity_threshold
+        )
+
+
+# `filter` implementations that only annotate the QuerySet and call `filter_annotation`
+_BATCHABLE_FILTER_METHODS = frozenset(
+    (
+        AnnotatedFilter.filter,
+        SearchQueryFilter.filter,
+        SearchRankFilter.filter,
+        TrigramFilter.filter,
+    )
+)
+
 
 class BaseRelatedFilter:
     """
@@ -171,7 +344,11 @@ class BaseRelatedFilter:
 
     @property
     def filterset(self) -> Type["BaseFilterSet"]:
-        """Lazy-load the filterset class if it is specified as a string."""
+        """
+        Lazy-load the filterset class if it is specified as a string.
+
+        The resolved class replaces the string, so the import only happens once.
+        """
         if isinstance(self._filterset, str):
             try:
                 # Assume absolute import path
@@ -180,7 +357,7 @@ class BaseRelatedFilter:
                 # Fallback to building import path relative to bind class
                 path = ".".join([self.bound_filterset.__module__, self._filterset])
                 self._filterset = import_string(path)
-            return self._filterset
+        return self._filterset
 
     @filterset.setter
     def filterset(self, value: Type["BaseFilterSet"]) -> None:
@@ -442,12 +442,19 @@ class AdvancedFilterSet(filterset.BaseFilterSet, metaclass=FilterSetMetaclass):
         )
         if key in self.filters:
             return self.filters[key]
-        for filter_value in self.filters.values():
-            if (
-                filter_value.field_name == field_name
-                and filter_value.lookup_expr == lookup_expr
-            ):
-                return filter_value
+        return self.filters_by_lookup.get((field_name, lookup_expr))
+
+    @property
+    def filters_by_lookup(self) -> Dict[Tuple[str, str], Filter]:
+        """Return the filters by their `(field_name, lookup_expr)` pair, built once."""
+        if not hasattr(self, "_filters_by_lookup"):
+            self._filters_by_lookup: Dict[Tuple[str, str], Filter] = {}
+            for filter_value in self.filters.values():
+                # Keep the first filter like the former linear scan did
+                self._filters_by_lookup.setdefault(
+                    (filter_value.field_name, filter_value.lookup_expr), filter_value
+                )
+        return self._filters_by_lookup
 
     def filter_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
         """Filter a queryset with a top level form's `cleaned_data`."""
@@ -463,8 +470,24 @@ class AdvancedFilterSet(filterset.BaseFilterSet, metaclass=FilterSetMetaclass):
         """Return a `QuerySetProxy` object for a form's `cleaned_data`."""
         qs = queryset
         q = models.Q()
+        # Annotated filters of the form share one `annotate` call (one clone)
+        annotations: Dict[str, Any] = {}
+        annotated_filters: List[Tuple[filters.AnnotatedFilter, str, Any]] = []
         for name, value in form.cleaned_data.items():
-            qs, q = self.find_filter(name).filter(QuerySetProxy(qs, q), value)
+            f = self.find_filter(name)
+            if isinstance(f, filters.AnnotatedFilter) and f.can_batch_annotation:
+                if not f.is_empty_value(value):
+                    annotation_name = f.next_annotation_name()
+                    annotations[annotation_name] = value.annotation_value
+                    annotated_filters.append((f, annotation_name, value))
+            else:
+                qs, q = f.filter(QuerySetProxy(qs, q), value)
+        if annotations:
+            qs = qs.annotate(**annotations)
+            for f, annotation_name, value in annotated_filters:
+                qs, q = f.filter_annotation(
+                    QuerySetProxy(qs, q), annotation_name, value
+                )
         and_q = models.Q()
         for and_form in form.and_forms:
             qs, new_q = self.get_queryset_proxy_for_form(qs, and_form)
@@ -490,20 +513,16 @@ class AdvancedFilterSet(filterset.BaseFilterSet, metaclass=FilterSetMetaclass):
         if not cls._meta.model:
             return filters
 
-        return OrderedDict(
-            [
-                *filters.items(),
-                *cls.create_full_text_search_filters(filters).items(),
-            ]
-        )
+        filters.update(cls.create_full_text_search_filters(filters))
+        return filters
 
     @classmethod
     def create_full_text_search_filters(
         cls,
-        base_filters: OrderedDict,
-    ) -> OrderedDict:
+        base_filters: Dict[str, Filter],
+    ) -> Dict[str, Filter]:
         """Create available full text search filters."""
-        new_filters = OrderedDict()
+        new_filters: Dict[str, Filter] = {}
         full_text_search_fields = cls.get_full_text_search_fields()
         if not len(full_text_search_fields):
             return new_filters
@@ -515,38 +534,47 @@ class AdvancedFilterSet(filterset.BaseFilterSet, metaclass=FilterSetMetaclass):
             return new_filters
         from .filters import SearchQueryFilter, SearchRankFilter, TrigramFilter
 
-        new_filters = OrderedDict(
-            [
-                *new_filters.items(),
-                *cls.create_special_filters(base_filters, SearchQueryFilter).items(),
-                *cls.create_special_filters(base_filters, SearchRankFilter).items(),
-            ]
+        new_filters.update(
+            cls.create_special_filters(
+                base_filters,
+                SearchQueryFilter,
+                vector_field=getattr(cls.Meta, "search_vector_field", None),
+            )
         )
+        new_filters.update(cls.create_special_filters(base_filters, SearchRankFilter))
         if not settings.HAS_TRIGRAM_EXTENSION:
             warnings.warn(
                 "Trigram search is not available because the `pg_trgm` extension is not installed.",
             )
             return new_filters
         for field_name in full_text_search_fields:
-            new_filters = OrderedDict(
-                [
-                    *new_filters.items(),
-                    *cls.create_special_filters(
-                        base_filters, TrigramFilter, field_name
-                    ).items(),
-                ]
+            new_filters.update(
+                cls.create_special_filters(
+                    base_filters,
+                    TrigramFilter,
+                    field_name,
+                    use_operator=getattr(cls.Meta, "trigram_use_operator", False),
+                    similarity_threshold=getattr(
+                        cls.Meta, "trigram_similarity_threshold", None
+                    ),
+                )
             )
         return new_filters
 
     @classmethod
     def create_special_filters(
         cls,
-        base_filters: OrderedDict,
+        base_filters: Dict[str, Filter],
         filter_class: Union[Type[Filter], Any],
         field_name: Optional[str] = None,
-    ) -> OrderedDict:
-        """Create special filters using a filter class and a field name."""
-        new_filters = OrderedDict()
+        **filter_kwargs,
+    ) -> Dict[str, Filter]:
+        """
+        Create special filters using a filter class and a field name.
+
+        `filter_kwargs` are passed to the filter class for every created filter.
+        """
+        new_filters: Dict[str, Filter] = {}
         for lookup_expr in filter_class.available_lookups:
             if field_name:
                 postfix_field_name = f"{field_name}{LOOKUP_SEP}{filter_class.postfix}"
@@ -557,6 +585,7 @@ class AdvancedFilterSet(filterset.BaseFilterSet, metaclass=FilterSetMetaclass):
                 new_filters[filter_name] = filter_class(
                     field_name=postfix_field_name,
                     lookup_expr=lookup_expr,
+                    **filter_kwargs,
                 )
         return new_filters
 
@@ -577,7 +606,7 @@ class AdvancedFilterSet(filterset.BaseFilterSet, metaclass=FilterSetMetaclass):
 
         for related_name in cls.related_filters:
             rf = cls.related_filters[related_name]
-            f = rf._filterset.get_fields()
+            f = rf.filterset.get_fields()
             for key, value in f.items():
                 fields.append((related_name + "__" + key, value))
 
@@ -1,6 +1,23 @@
 """Functions for converting tree data into data suitable for the FilterSet."""
 
-from typing import Any, Dict, List, Optional, Type, Union
+import operator
+import re
+from functools import lru_cache, reduce
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
 
 # Django imports
 from django.contrib.postgres.search import (
@@ -35,7 +52,21 @@ from .input_types import (
     TrigramSearchKind,
 )
 
-DATA_FACTORIES = {}  # Define this dict based on your actual factories
+# Suffix of keys that use the default lookup expression, e.g. `__exact`
+_DEFAULT_LOOKUP_SUFFIX = LOOKUP_SEP + django_settings.DEFAULT_LOOKUP_EXPR
+_DEFAULT_LOOKUP_SUFFIX_LEN = len(_DEFAULT_LOOKUP_SUFFIX)
+
+# Logical keys of the search query input type, fixed when the input types are built
+_AND_KEY = settings.AND_KEY
+_OR_KEY = settings.OR_KEY
+_NOT_KEY = settings.NOT_KEY
+
+
+def strip_default_lookup_expr(key: str) -> str:
+    """Remove the trailing default lookup expression from the key."""
+    if key.endswith(_DEFAULT_LOOKUP_SUFFIX):
+        return key[:-_DEFAULT_LOOKUP_SUFFIX_LEN]
+    return key
 
 
 def tree_input_type_to_data(
@@ -43,38 +74,75 @@ def tree_input_type_to_data(
     tree_input_type: InputObjectTypeContainer,
     prefix: str = "",
 ) -> Dict[str, Any]:
-    """Convert a tree_input_type to a FilterSet data."""
+    """
+    Convert a tree_input_type to a FilterSet data.
+
+    The tree is walked with an explicit stack instead of recursion, so deeply nested
+    `and`/`or`/`not` filters do not grow the Python call stack.
+    Each stack entry holds the data dict to fill, the key prefix and an iterator
+    over the items of the input node, which keeps the order of the resulting keys.
+    """
     result: Dict[str, Any] = {}
-    for key, value in tree_input_type.items():
-        # Handling logical operations on the filter set
-        if key in ("and", "or"):
-            result[key] = [
-                tree_input_type_to_data(filterset_class, subtree) for subtree in value
-            ]
-        elif key == "not":
-            result[key] = tree_input_type_to_data(filterset_class, value)
-        else:
+    stack: List[Tuple[Dict[str, Any], str, Iterator[Tuple[str, Any]]]] = [
+        (result, prefix, iter(tree_input_type.items())),
+    ]
+    while stack:
+        data, node_prefix, items = stack[-1]
+        for key, value in items:
+            # Handling logical operations on the filter set
+            if key in ("and", "or"):
+                # Every subtree dict is part of the result, so only the
+                # intermediate zip list is avoided by pushing in reverse by index
+                subtrees_data = data[key] = [{} for _ in value]
+                for i in range(len(value) - 1, -1, -1):
+                    stack.append((subtrees_data[i], "", iter(value[i].items())))
+                break
+            elif key == "not":
+                data[key] = {}
+                stack.append((data[key], "", iter(value.items())))
+                break
             # Translate remaining key-value pairs into data suitable for the FilterSet
-            result.update(
-                create_data(
-                    (prefix + LOOKUP_SEP + key if prefix else key).replace(
-                        LOOKUP_SEP + django_settings.DEFAULT_LOOKUP_EXPR,
-                        "",
-                    ),
-                    value,
-                    filterset_class,
-                ),
-            )
+            data_key, factory = resolve_data_key(node_prefix, key)
+            if factory:
+                data.update(factory(value, data_key, filterset_class))
+            elif isinstance(value, InputObjectTypeContainer):
+                # Descend into the nested field, writing into the same data dict
+                stack.append((data, data_key, iter(value.items())))
+                break
+            else:
+                data[data_key] = value
+        else:
+            stack.pop()
     return result
 
 
+@lru_cache(maxsize=4096)
+def resolve_data_key(
+    prefix: str, key: str
+) -> Tuple[str, Optional[Callable[..., Dict[str, Any]]]]:
+    """
+    Return the FilterSet data key for an input key under a prefix and its data factory.
+
+    The result only depends on the two strings and the set of input keys is bounded
+    by the GraphQL schema, so each key path is resolved once instead of per request.
+    """
+    data_key = strip_default_lookup_expr(prefix + LOOKUP_SEP + key if prefix else key)
+    return data_key, find_data_factory(data_key)
+
+
+def find_data_factory(key: str) -> Optional[Callable[..., Dict[str, Any]]]:
+    """Return the data factory for the key or None if the key is a regular one."""
+    match = DATA_FACTORIES_PATTERN.search(key)
+    return DATA_FACTORIES[match.group(0)] if match else None
+
+
 def create_data(
     key: str, value: Any, filterset_class: Type[AdvancedFilterSet]
 ) -> Dict[str, Any]:
     """Create data from a key and a value based on factory methods."""
-    for factory_key, factory in DATA_FACTORIES.items():
-        if factory_key in key:
-            return factory(value, key, filterset_class)
+    factory = find_data_factory(key)
+    if factory:
+        return factory(value, key, filterset_class)
     # If the value is an InputObjectTypeContainer, convert it into a suitable FilterSet data
     if isinstance(value, InputObjectTypeContainer):
         return tree_input_type_to_data(filterset_class, value, key)
@@ -98,8 +166,17 @@ def create_search_query_data(
     Returns:
     - A dictionary containing the search query filter values
     """
-    # Create the SearchVector and SearchQuery from the input_type
-    annotation_value = create_search_vector(input_type.vector, filterset_class)
+    search_query_filter = filterset_class.base_filters.get(key)
+    if (
+        isinstance(search_query_filter, SearchQueryFilter)
+        and search_query_filter.vector_field
+    ):
+        # The filter searches a persisted column, a SearchVector would not be used
+        annotation_value = None
+    elif input_type.vector is None:
+        raise ValidationError("The `vector` field is required for the search query.")
+    else:
+        annotation_value = create_search_vector(input_type.vector, filterset_class)
     search_value = create_search_query(input_type.query)
 
     return {
@@ -127,35 +204,37 @@ def create_search_rank_data(
     Returns:
     - A dictionary containing the search rank filter values.
     """
-    # Initialize the result dictionary
-    rank_data = {}
+    # Bind the container lookup once, it is used for every optional field
+    get = input_type.get
+
+    # Create the SearchRank data once, it is the same for every lookup
+    search_rank_data = {
+        "vector": create_search_vector(input_type.vector, filterset_class),
+        "query": create_search_query(input_type.query),
+        "cover_density": input_type.cover_density,
+    }
+
+    # If weights are provided, add them to the SearchRank data
+    weights = get("weights")
+    if weights:
+        search_rank_data["weights"] = create_search_rank_weights(weights)
+
+    # If normalization is provided, add it to the SearchRank data
+    normalization = get("normalization")
+    if normalization:
+        search_rank_data["normalization"] = normalization
+
+    # Expressions are copied when resolved, so one annotation serves all lookups
+    annotation_value = SearchRank(**search_rank_data)
 
     # Iterate through each lookup in the input_type.lookups dictionary
+    rank_data = {}
     for lookup, value in input_type.lookups.items():
-        # Create the SearchRank data
-        search_rank_data = {
-            "vector": create_search_vector(input_type.vector, filterset_class),
-            "query": create_search_query(input_type.query),
-            "cover_density": input_type.cover_density,
-        }
-
-        # If weights are provided, add them to the SearchRank data
-        weights = input_type.get("weights")
-        if weights:
-            search_rank_data["weights"] = create_search_rank_weights(weights)
-
-        # If normalization is provided, add it to the SearchRank data
-        normalization = input_type.get("normalization")
-        if normalization:
-            search_rank_data["normalization"] = normalization
-
         # Create the complete key for this specific lookup
-        complete_key = (key + LOOKUP_SEP + lookup).replace(
-            LOOKUP_SEP + django_settings.DEFAULT_LOOKUP_EXPR, ""
-        )
+        complete_key = strip_default_lookup_expr(key + LOOKUP_SEP + lookup)
         # Add the SearchRank value to the result dictionary
         rank_data[complete_key] = SearchRankFilter.Value(
-            annotation_value=SearchRank(**search_rank_data),
+            annotation_value=annotation_value,
             search_value=value,
         )
 
@@ -171,16 +250,13 @@ def create_trigram_data(
         trigram_class = TrigramSimilarity
     else:
         trigram_class = TrigramDistance
+    # The key is `<field path>__trigram`, the annotation is the same for all lookups
+    field_path = key.rpartition(LOOKUP_SEP)[0]
+    annotation_value = trigram_class(field_path, input_type.value)
     for lookup, value in input_type.lookups.items():
-        k = (key + LOOKUP_SEP + lookup).replace(
-            LOOKUP_SEP + django_settings.DEFAULT_LOOKUP_EXPR,
-            "",
-        )
+        k = strip_default_lookup_expr(key + LOOKUP_SEP + lookup)
         trigram_data[k] = TrigramFilter.Value(
-            annotation_value=trigram_class(
-                LOOKUP_SEP.join(key.split(LOOKUP_SEP)[:-1]),
-                input_type.value,
-            ),
+            annotation_value=annotation_value,
             search_value=value,
         )
     return trigram_data
@@ -206,14 +282,15 @@ def create_search_vector(
 
     # Initialize a dictionary to hold the keyword arguments for SearchVector
     search_vector_data = {}
+    get = input_type.get
 
     # Check if the config is provided in input_type and create the search config accordingly
-    config = input_type.get("config")
+    config = get("config")
     if config:
         search_vector_data["config"] = create_search_config(config)
 
     # Check if the weight is provided in input_type and add it to search_vector_data
-    weight = input_type.get("weight")
+    weight = get("weight")
     if weight:
         search_vector_data["weight"] = weight.value
 
@@ -238,45 +315,55 @@ def create_search_query(
     # Validate the incoming search query
     validate_search_query(input_type)
 
-    # Initialize the search query
-    search_query = None
+    # Bind the container lookup once, it is used for every optional field
+    get = input_type.get
 
     # Get the base query value and optional configuration
-    value = input_type.get("value")
+    value = get("value")
     if value:
-        config = input_type.get("config")
+        config = get("config")
         search_query = SearchQuery(
-            input_type.value,
+            value,
             config=create_search_config(config) if config else None,
         )
-
-    and_search_query = None
-    for and_input_type in input_type.get(settings.AND_KEY, []):
-        if and_search_query is None:
-            and_search_query = create_search_query(and_input_type)
-        else:
-            and_search_query = and_search_query & create_search_query(and_input_type)
-    or_search_query = None
-    for or_input_type in input_type.get(settings.OR_KEY, []):
-        if or_search_query is None:
-            or_search_query = create_search_query(or_input_type)
-        else:
-            or_search_query = or_search_query | create_search_query(or_input_type)
-    not_input_type = input_type.get(settings.NOT_KEY)
-    not_search_query = create_search_query(not_input_type) if not_input_type else None
-    valid_queries = (
+    else:
+        search_query = None
+
+    # Build the logical subqueries, empty fields produce no query at all
+    and_search_queries = [
+        create_search_query(and_input_type) for and_input_type in get(_AND_KEY, ())
+    ]
+    or_search_queries = [
+        create_search_query(or_input_type) for or_input_type in get(_OR_KEY, ())
+    ]
+    not_input_type = get(_NOT_KEY)
+
+    valid_queries = [
         q
-        for q in (and_search_query, or_search_query, not_search_query)
+        for q in (
+            search_query,
+            reduce(operator.and_, and_search_queries) if and_search_queries else None,
+            reduce(operator.or_, or_search_queries) if or_search_queries else None,
+            create_search_query(not_input_type) if not_input_type else None,
+        )
         if q is not None
-    )
-    for valid_query in valid_queries:
-        search_query = search_query & valid_query if search_query else valid_query
-    return search_query
+    ]
+    return reduce(operator.and_, valid_queries) if valid_queries else None
+
+
+@lru_cache(maxsize=256)
+def create_search_config_field(name: str) -> models.F:
+    """Return a cached `F` object, it is immutable and can be shared between queries."""
+    return models.F(name)
 
 
 def create_search_config(input_type: SearchConfigInputType) -> Union[str, models.F]:
     """Create a `SearchVector` or `SearchQuery` object config."""
-    return models.F(input_type.value) if input_type.is_field else input_type.value
+    return (
+        create_search_config_field(input_type.value)
+        if input_type.is_field
+        else input_type.value
+    )
 
 
 def create_search_rank_weights(input_type: SearchRankWeightsInputType) -> List[float]:
@@ -284,39 +371,56 @@ def create_search_rank_weights(input_type: SearchRankWeightsInputType) -> List[f
     return [input_type.D, input_type.C, input_type.B, input_type.A]
 
 
+@lru_cache(maxsize=None)
+def get_full_text_search_field_names(
+    filterset_class: Type[AdvancedFilterSet],
+) -> FrozenSet[str]:
+    """Return the cached names of the full text search fields of a filterset class."""
+    return frozenset(filterset_class.get_full_text_search_fields())
+
+
 def validate_search_vector_fields(
     filterset_class: Type[AdvancedFilterSet],
     fields: List[str],
 ) -> None:
     """Validate that fields is included in full text search fields."""
-    full_text_search_fields = filterset_class.get_full_text_search_fields()
-    for field in fields:
-        if field not in full_text_search_fields:
-            raise ValidationError(
+    full_text_search_fields = get_full_text_search_field_names(filterset_class)
+    invalid_fields = [field for field in fields if field not in full_text_search_fields]
+    if invalid_fields:
+        raise ValidationError(
+            [
                 f"The `{field}` field is not included in full text search fields"
-            )
+                for field in invalid_fields
+            ]
+        )
 
 
 def validate_search_query(
     input_type: Union[SearchQueryInputType, InputObjectTypeContainer],
 ) -> None:
     """Validate that search query contains at least one required field."""
-    if all(
-        [
-            "value" not in input_type,
-            settings.AND_KEY not in input_type,
-            settings.OR_KEY not in input_type,
-            settings.NOT_KEY not in input_type,
-        ]
+    # Short-circuits on the first present field
+    if not (
+        "value" in input_type
+        or _AND_KEY in input_type
+        or _OR_KEY in input_type
+        or _NOT_KEY in input_type
     ):
         raise ValidationError(
             "The search query must contains at least one required field "
-            f"such as `value`, `{settings.AND_KEY}`, `{settings.OR_KEY}`, `{settings.NOT_KEY}`.",
+            f"such as `value`, `{_AND_KEY}`, `{_OR_KEY}`, `{_NOT_KEY}`.",
         )
 
 
-DATA_FACTORIES = {
-    SearchQueryFilter.postfix: create_search_query_data,
-    SearchRankFilter.postfix: create_search_rank_data,
-    TrigramFilter.postfix: create_trigram_data,
-}
+# Data factories by the postfix of the special filters, read-only once built
+DATA_FACTORIES: Mapping[str, Callable[..., Dict[str, Any]]] = MappingProxyType(
+    {
+        SearchQueryFilter.postfix: create_search_query_data,
+        SearchRankFilter.postfix: create_search_rank_data,
+        TrigramFilter.postfix: create_trigram_data,
+    }
+)
+# One C-level scan for any of the `DATA_FACTORIES` keys
+DATA_FACTORIES_PATTERN: Pattern[str] = re.compile(
+    "|".join(re.escape(factory_key) for factory_key in DATA_FACTORIES)
+)
@@ -107,8 +107,7 @@ class SearchQueryFilterInputType(graphene.InputObjectType):
 
     vector = graphene.InputField(
         SearchVectorInputType,
-        required=True,
-        description="The SearchVector to be used",
+        description="The SearchVector to be used, required unless the filter has a `vector_field`",
     )
     query = graphene.InputField(
         SearchQueryInputType,
@@ -10,6 +10,9 @@ Functions
 - `lookups_for_field`: Determines the set of valid lookup expressions for a given model field.
 - `lookups_for_transform`: Gets valid lookups for a given transform.
 
+Both functions cache their results per field (or transform) class and the lookups
+registered on it, so the transform graph of a field class is only expanded once.
+
 Usage
 -----
 ```python
@@ -22,7 +25,7 @@ lookups = lookups_for_field(models.CharField(), support_negation=True)
 transform_lookups = lookups_for_transform(models.Transform())
 """
 
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.expressions import Expression
@@ -30,6 +33,26 @@ from django.db.models.fields import Field
 from django.db.models.lookups import Transform
 
 
+# Cache of the lookup expressions, see `_get_cache_key` for the key format
+_lookups_cache: Dict[Tuple[Any, ...], Tuple[str, ...]] = {}
+
+
+def _get_cache_key(
+    obj: Any, field: Field, lookups: Dict[str, Any]
+) -> Optional[Tuple[Any, ...]]:
+    """
+    Return a key of the lookups cache or None if the lookups must not be cached.
+
+    The lookup expressions only depend on the classes of the field (or transform),
+    of its output field and on the registered lookups. Fields with a `base_field`
+    (e.g. `ArrayField`) produce transforms whose output depends on the instance,
+    so they are not cached.
+    """
+    if hasattr(field, "base_field"):
+        return None
+    return type(obj), type(field), tuple(lookups.items())
+
+
 def lookups_for_field(model_field: Field) -> List[str]:
     """
     Generate a list of all possible lookup expressions for a given model field.
@@ -40,9 +63,14 @@ def lookups_for_field(model_field: Field) -> List[str]:
     Returns:
         A list containing all lookup expressions applicable to the model field.
     """
+    field_lookups = model_field.get_lookups()
+    cache_key = _get_cache_key(model_field, model_field, field_lookups)
+    if cache_key in _lookups_cache:
+        return list(_lookups_cache[cache_key])
+
     lookups: List[str] = []
 
-    for expr, lookup in model_field.get_lookups().items():
+    for expr, lookup in field_lookups.items():
         if issubclass(lookup, Transform):
             transform = lookup(Expression(model_field))
             lookups += [
@@ -52,6 +80,8 @@ def lookups_for_field(model_field: Field) -> List[str]:
         else:
             lookups.append(expr)
 
+    if cache_key is not None:
+        _lookups_cache[cache_key] = tuple(lookups)
     return lookups
 
 
@@ -72,9 +102,15 @@ def lookups_for_transform(transform: Transform) -> List[str]:
     Returns:
         A list containing all lookup expressions applicable to the transform.
     """
+    output_field = transform.output_field
+    transform_lookups = output_field.get_lookups()
+    cache_key = _get_cache_key(transform, output_field, transform_lookups)
+    if cache_key in _lookups_cache:
+        return list(_lookups_cache[cache_key])
+
     lookups: List[str] = []
 
-    for expr, lookup in transform.output_field.get_lookups().items():
+    for expr, lookup in transform_lookups.items():
         if issubclass(lookup, Transform):
             # Skip if type matches to avoid infinite recursion
             if type(transform) is lookup:
@@ -88,4 +124,6 @@ def lookups_for_transform(transform: Transform) -> List[str]:
         else:
             lookups.append(expr)
 
+    if cache_key is not None:
+        _lookups_cache[cache_key] = tuple(lookups)
     return lookups
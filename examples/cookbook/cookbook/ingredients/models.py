@@ -2,14 +2,14 @@ from django.db import models
 
 
 class Category(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
 
     def __str__(self):
         return self.name
 
 
 class Ingredient(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
     notes = models.TextField(null=True, blank=True)
     category = models.ForeignKey(
         Category, related_name="ingredients", on_delete=models.CASCADE
@@ -28,6 +28,11 @@ class IngredientNode(DjangoObjectType):
             "category__name": ["exact"],
         }
 
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        # Fetch the category with the ingredient instead of one query per node
+        return queryset.select_related("category")
+
 
 class Query:
     category = Node.Field(CategoryNode)
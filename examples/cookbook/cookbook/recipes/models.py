@@ -4,10 +4,10 @@ from cookbook.ingredients.models import Ingredient
 
 
 class Recipe(models.Model):
-    title = models.CharField(max_length=100)
+    title = models.CharField(max_length=100, db_index=True)
     instructions = models.TextField()
 
-    def __unicode__(self):
+    def __str__(self):
         return self.title
 
 
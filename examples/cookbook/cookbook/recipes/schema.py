@@ -25,6 +25,11 @@ class RecipeIngredientNode(DjangoObjectType):
             "recipe__title": ["icontains"],
         }
 
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        # Fetch both sides of the amount instead of two queries per node
+        return queryset.select_related("recipe", "ingredient")
+
 
 class Query:
     recipe = Node.Field(RecipeNode)
@@ -0,0 +1 @@
+"""Django project used by the test suite."""
@@ -0,0 +1,182 @@
+"""Tests for the special filters."""
+
+import pytest
+from django.contrib.auth.models import User
+from django.contrib.postgres.lookups import TrigramSimilar
+from django.contrib.postgres.search import (
+    SearchQuery,
+    TrigramDistance,
+    TrigramSimilarity,
+)
+from django.core.exceptions import ValidationError
+from django.db import models
+from django_graphene_filters import AdvancedFilterSet, SearchQueryFilter, TrigramFilter
+from django_graphene_filters import filterset
+from django_graphene_filters.filterset import QuerySetProxy
+from django_graphene_filters.input_data_factories import tree_input_type_to_data
+from django_graphene_filters.input_types import (
+    SearchQueryFilterInputType,
+    SearchQueryInputType,
+)
+
+
+class UserFilter(AdvancedFilterSet):
+    """FilterSet with a search query filter on a persisted search vector column."""
+
+    search_query = SearchQueryFilter(
+        field_name="search_query",
+        vector_field="search_vector",
+    )
+
+    class Meta:
+        """FilterSet options."""
+
+        model = User
+        fields = {"username": ["exact"]}
+
+
+class VectorUserFilter(AdvancedFilterSet):
+    """FilterSet with a search query filter that needs a `SearchVector`."""
+
+    search_query = SearchQueryFilter(field_name="search_query")
+
+    class Meta:
+        """FilterSet options."""
+
+        model = User
+        fields = {"username": ["exact"]}
+
+
+def search_query_input(**kwargs) -> SearchQueryFilterInputType:
+    """Return the input of the `search_query` filter."""
+    return SearchQueryFilterInputType._meta.container(
+        {"query": SearchQueryInputType._meta.container({"value": "john"}), **kwargs}
+    )
+
+
+def test_search_query_filter_vector_field() -> None:
+    """Test that a filter with `vector_field` searches the column without a vector input."""
+    data = tree_input_type_to_data(
+        UserFilter,
+        {"search_query": search_query_input()},
+    )
+    value = data["search_query"]
+    assert value.annotation_value is None
+    assert isinstance(value.search_value, SearchQuery)
+
+    search_query_filter = UserFilter.base_filters["search_query"]
+    assert not search_query_filter.can_batch_annotation
+    qs = search_query_filter.filter(QuerySetProxy(User.objects.all()), value)
+    assert qs.q == models.Q(search_vector__exact=value.search_value)
+    assert not qs.query.annotations
+
+
+def test_search_query_filter_requires_vector() -> None:
+    """Test that a filter without `vector_field` requires the vector input."""
+    with pytest.raises(ValidationError):
+        tree_input_type_to_data(
+            VectorUserFilter,
+            {"search_query": search_query_input()},
+        )
+
+
+def test_create_special_filters_kwargs() -> None:
+    """Test that special filters are created with the passed keyword arguments."""
+    new_filters = VectorUserFilter.create_special_filters(
+        {},
+        SearchQueryFilter,
+        vector_field="search_vector",
+    )
+    assert new_filters["search_query"].vector_field == "search_vector"
+
+
+def test_trigram_filter_operator() -> None:
+    """Test that a similarity filter above the threshold adds the `%` operator."""
+    trigram_filter = TrigramFilter(
+        field_name="username__trigram",
+        lookup_expr="gt",
+        use_operator=True,
+    )
+    value = TrigramFilter.Value(TrigramSimilarity("username", "john"), 0.5)
+    assert trigram_filter.can_use_operator(value)
+    qs = trigram_filter.filter_annotation(
+        QuerySetProxy(User.objects.all()), "similarity", value
+    )
+    assert qs.q == models.Q(similarity__gt=0.5, similarity_similar=True)
+    assert isinstance(qs.query.annotations["similarity_similar"], TrigramSimilar)
+
+
+def test_trigram_filter_operator_joins() -> None:
+    """Test that the `%` operator reuses the joins of a multi-valued relation."""
+
+    class GroupUserFilter(AdvancedFilterSet):
+        group_trigram = TrigramFilter(
+            field_name="groups__name__trigram",
+            lookup_expr="gt",
+            use_operator=True,
+        )
+
+        class Meta:
+            """FilterSet options."""
+
+            model = User
+            fields = {"username": ["exact"]}
+
+    value = TrigramFilter.Value(TrigramSimilarity("groups__name", "admin"), 0.5)
+    filterset = GroupUserFilter(
+        data={"group_trigram": value},
+        queryset=User.objects.all(),
+    )
+    tables = [join.table_name for join in filterset.qs.query.alias_map.values()]
+    assert tables == ["auth_user", "auth_user_groups", "auth_group"]
+
+
+@pytest.mark.parametrize(
+    ("use_operator", "lookup_expr", "value"),
+    [
+        (False, "gt", TrigramFilter.Value(TrigramSimilarity("username", "john"), 0.5)),
+        (True, "lt", TrigramFilter.Value(TrigramSimilarity("username", "john"), 0.5)),
+        (True, "gt", TrigramFilter.Value(TrigramSimilarity("username", "john"), 0.3)),
+        (True, "gt", TrigramFilter.Value(TrigramDistance("username", "john"), 0.5)),
+        (True, "gt", TrigramFilter.Value(TrigramSimilarity("username", "john"), None)),
+    ],
+)
+def test_trigram_filter_no_operator(
+    use_operator: bool,
+    lookup_expr: str,
+    value: TrigramFilter.Value,
+) -> None:
+    """Test that the `%` operator is only added when it keeps the result."""
+    trigram_filter = TrigramFilter(
+        field_name="username__trigram",
+        lookup_expr=lookup_expr,
+        use_operator=use_operator,
+    )
+    assert not trigram_filter.can_use_operator(value)
+    qs = trigram_filter.filter_annotation(
+        QuerySetProxy(User.objects.all()), "similarity", value
+    )
+    assert qs.q == models.Q(**{f"similarity__{lookup_expr}": value.search_value})
+
+
+def test_trigram_filter_meta_options(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that generated trigram filters use the FilterSet Meta options."""
+    with pytest.warns(UserWarning):
+
+        class TrigramUserFilter(AdvancedFilterSet):
+            class Meta:
+                """FilterSet options."""
+
+                model = User
+                fields = {"username": ["exact", "full_text_search"]}
+                trigram_use_operator = True
+                trigram_similarity_threshold = 0.4
+
+    monkeypatch.setattr(filterset.settings, "IS_POSTGRESQL", True)
+    monkeypatch.setattr(filterset.settings, "HAS_TRIGRAM_EXTENSION", True)
+    new_filters = TrigramUserFilter.create_full_text_search_filters(
+        TrigramUserFilter.base_filters
+    )
+    trigram_filter = new_filters["username__trigram__gt"]
+    assert trigram_filter.use_operator
+    assert trigram_filter.similarity_threshold == 0.4
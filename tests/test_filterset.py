@@ -0,0 +1,87 @@
+"""Tests for the `AdvancedFilterSet` class."""
+
+from typing import Any, Dict, List
+
+import pytest
+from django.contrib.auth.models import User
+from django.db import models
+from django.db.models import Value
+from django_graphene_filters import AdvancedFilterSet, AnnotatedFilter
+
+
+def test_annotated_filter_with_method() -> None:
+    """Test that an `AnnotatedFilter` declared with `method` calls the method."""
+    calls: List[AnnotatedFilter.Value] = []
+
+    class UserFilter(AdvancedFilterSet):
+        custom = AnnotatedFilter(
+            field_name="custom",
+            lookup_expr="exact",
+            method="filter_custom",
+        )
+
+        class Meta:
+            model = User
+            fields = {"username": ["exact"]}
+
+        def filter_custom(
+            self,
+            queryset: models.QuerySet,
+            name: str,
+            value: AnnotatedFilter.Value,
+        ) -> models.QuerySet:
+            calls.append(value)
+            return queryset.filter(username="zzz")
+
+    value = AnnotatedFilter.Value(annotation_value=Value(1), search_value=1)
+    filterset = UserFilter(data={"custom": value}, queryset=User.objects.all())
+    query = str(filterset.qs.query)
+    assert calls == [value]
+    assert "custom_annotated" not in query
+    assert query.endswith('WHERE "auth_user"."username" = zzz')
+
+
+def test_annotated_filters_share_annotate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the annotated filters of a form are applied with one `annotate` call."""
+    annotate_calls: List[Dict[str, Any]] = []
+    annotate = models.QuerySet.annotate
+
+    def counting_annotate(
+        self: models.QuerySet, *args: Any, **kwargs: Any
+    ) -> models.QuerySet:
+        annotate_calls.append(kwargs)
+        return annotate(self, *args, **kwargs)
+
+    monkeypatch.setattr(models.QuerySet, "annotate", counting_annotate)
+
+    class UserFilter(AdvancedFilterSet):
+        id_gte = AnnotatedFilter(field_name="user_id", lookup_expr="gte")
+        id_lte = AnnotatedFilter(field_name="user_id", lookup_expr="lte")
+
+        class Meta:
+            model = User
+            fields = {"username": ["exact"]}
+
+    filterset = UserFilter(
+        data={
+            "id_gte": AnnotatedFilter.Value(models.F("id"), 1),
+            "id_lte": AnnotatedFilter.Value(models.F("id"), 2),
+            "or": [
+                {"id_gte": AnnotatedFilter.Value(models.F("id"), 3)},
+                {"username": "john"},
+            ],
+        },
+        queryset=User.objects.all(),
+    )
+    qs = filterset.qs
+    # One call for the top level form with both filters, one for the `or` form
+    assert [sorted(kwargs) for kwargs in annotate_calls] == [
+        [
+            f"user_id_annotated_{UserFilter.base_filters['id_gte'].creation_counter}_0",
+            f"user_id_annotated_{UserFilter.base_filters['id_lte'].creation_counter}_0",
+        ],
+        [f"user_id_annotated_{UserFilter.base_filters['id_gte'].creation_counter}_1"],
+    ]
+    assert '"auth_user"."id" >= 1' in str(qs.query)
+    assert '"auth_user"."id" <= 2' in str(qs.query)
+    assert '"auth_user"."id" >= 3' in str(qs.query)
@@ -0,0 +1,156 @@
+"""Tests for converting tree input data into FilterSet data."""
+
+from typing import Any, Dict
+
+import graphene
+import pytest
+from django.contrib.auth.models import User
+from django_graphene_filters import AdvancedFilterSet
+from django_graphene_filters.input_data_factories import (
+    strip_default_lookup_expr,
+    tree_input_type_to_data,
+)
+from graphene.types.inputobjecttype import InputObjectTypeContainer
+
+
+class UserFilter(AdvancedFilterSet):
+    """FilterSet used to convert the input data."""
+
+    class Meta:
+        """FilterSet options."""
+
+        model = User
+        fields = {"username": ["exact", "icontains"]}
+
+
+class NodeInputType(graphene.InputObjectType):
+    """Input type whose container holds the nested input fields."""
+
+    exact = graphene.String()
+
+
+def node(**kwargs: Any) -> InputObjectTypeContainer:
+    """Return an input object container for a nested field."""
+    return NodeInputType._meta.container(kwargs)
+
+
+def test_tree_input_type_to_data_fields() -> None:
+    """Test that nested field containers are flattened into lookup keys."""
+    data = tree_input_type_to_data(
+        UserFilter,
+        {
+            "username": node(exact="john", icontains="jo"),
+            "groups": node(name=node(exact="admin", istartswith="ad")),
+            "email": "john@example.com",
+        },
+    )
+    assert data == {
+        "username": "john",
+        "username__icontains": "jo",
+        "groups__name": "admin",
+        "groups__name__istartswith": "ad",
+        "email": "john@example.com",
+    }
+    assert list(data) == [
+        "username",
+        "username__icontains",
+        "groups__name",
+        "groups__name__istartswith",
+        "email",
+    ]
+
+
+def test_tree_input_type_to_data_prefix() -> None:
+    """Test that the keys of the tree are prefixed with the passed prefix."""
+    data = tree_input_type_to_data(
+        UserFilter,
+        node(exact="admin", name=node(icontains="ad")),
+        "groups",
+    )
+    assert data == {"groups": "admin", "groups__name__icontains": "ad"}
+
+
+def test_tree_input_type_to_data_logical_operators() -> None:
+    """Test that `and`, `or` and `not` subtrees keep their structure and order."""
+    data = tree_input_type_to_data(
+        UserFilter,
+        {
+            "username": node(exact="john"),
+            "and": [
+                {"email": node(icontains="example")},
+                {
+                    "or": [
+                        {"groups": node(name=node(exact="admin"))},
+                        {"not": {"is_staff": node(exact=True)}},
+                    ],
+                },
+                {},
+            ],
+            "or": [],
+            "not": {
+                "and": [{"username": node(icontains="jo")}],
+                "groups": node(name=node(exact="guest")),
+            },
+            "is_active": node(exact=True),
+        },
+    )
+    assert data == {
+        "username": "john",
+        "and": [
+            {"email__icontains": "example"},
+            {
+                "or": [
+                    {"groups__name": "admin"},
+                    {"not": {"is_staff": True}},
+                ],
+            },
+            {},
+        ],
+        "or": [],
+        "not": {
+            "and": [{"username__icontains": "jo"}],
+            "groups__name": "guest",
+        },
+        "is_active": True,
+    }
+    assert list(data) == ["username", "and", "or", "not", "is_active"]
+    assert list(data["not"]) == ["and", "groups__name"]
+
+
+def test_tree_input_type_to_data_deep_nesting() -> None:
+    """Test that deeply nested `not` subtrees do not hit the recursion limit."""
+    depth = 5000
+    tree: Dict[str, Any] = {"username": node(exact="john")}
+    for _ in range(depth):
+        tree = {"not": tree}
+
+    data = tree_input_type_to_data(UserFilter, tree)
+    for _ in range(depth):
+        data = data["not"]
+    assert data == {"username": "john"}
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("username__exact", "username"),
+        ("groups__name__exact", "groups__name"),
+        ("username__iexact", "username__iexact"),
+        ("username", "username"),
+        ("foo__exact_match", "foo__exact_match"),
+        ("foo__exact_match__exact", "foo__exact_match"),
+        ("foo__exact__name", "foo__exact__name"),
+    ],
+)
+def test_strip_default_lookup_expr(key: str, expected: str) -> None:
+    """Test that only a trailing default lookup expression is removed."""
+    assert strip_default_lookup_expr(key) == expected
+
+
+def test_tree_input_type_to_data_exact_in_field_name() -> None:
+    """Test that a field name starting with the default lookup is kept intact."""
+    data = tree_input_type_to_data(
+        UserFilter,
+        {"foo": node(exact_match=node(exact="x", icontains="y"))},
+    )
+    assert data == {"foo__exact_match": "x", "foo__exact_match__icontains": "y"}